@@ -3,7 +3,8 @@ Configuration settings for the English to Local Languages Translator
 """
 
 import os
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 
 
 
@@ -15,6 +16,7 @@ class Config:
     PORT: int = 8000
     DEBUG: bool = True
     LANGUAGE = "en-US"
+    MAX_UPLOAD_BYTES: int = 25 * 1024 * 1024
 
     
     # CSV file settings
@@ -32,6 +34,19 @@ class Config:
     GOOGLE_TRANSLATE_MAX_RETRIES: int = 3
     GOOGLE_TRANSLATE_RETRY_DELAY: tuple = (1, 3)  # Random delay between retries
     GOOGLE_TRANSLATE_RATE_LIMIT_DELAY: int = 5
+    GOOGLE_TRANSLATE_BATCH_SIZE: int = 100  # Words per batched request
+    
+    # Persistent Google Translate cache
+    GOOGLE_TRANSLATE_CACHE_DIR: str = os.path.expanduser("~/.local-translator/cache")
+    GOOGLE_TRANSLATE_CACHE_SIZE_LIMIT: int = 100 * 1024 * 1024  # bytes
+    GOOGLE_TRANSLATE_CACHE_TTL: int = 30 * 24 * 60 * 60  # seconds
+    
+    # Maximum number of (word, language) results kept in the translation cache
+    TRANSLATION_CACHE_SIZE: int = 10000
+    
+    # Minimum RapidFuzz token_sort_ratio (0-100) for a fuzzy CSV match; extra words count against
+    # the score, so sentences do not match the single entries they contain
+    FUZZY_MATCH_CUTOFF: int = 88
     
     # Supported languages
     SUPPORTED_LANGUAGES: Dict[str, str] = {
@@ -120,6 +135,13 @@ class Config:
         }
     }
     
+    # Single-level (language, word) view of FALLBACK_TRANSLATIONS, so a lookup is one hash probe
+    _FLAT_FALLBACK: Dict[Tuple[str, str], str] = {
+        (language, word): translation
+        for language, words in FALLBACK_TRANSLATIONS.items()
+        for word, translation in words.items()
+    }
+    
     # API response messages
     MESSAGES: Dict[str, str] = {
         "empty_word": "Please enter a valid English word",
@@ -141,22 +163,22 @@ class Config:
         "animation_duration": 500  # milliseconds
     }
     
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _available_csv_files(cls) -> Tuple[str, ...]:
+        """Probe the filesystem for CSV files once per process"""
+        return tuple(file for file in cls.CSV_FILES if os.path.exists(file))
+    
     @classmethod
     def get_csv_file_path(cls) -> str:
         """Get the first available CSV file path"""
-        for file in cls.CSV_FILES:
-            if os.path.exists(file):
-                return file
-        return None
+        available_files = cls._available_csv_files()
+        return available_files[0] if available_files else None
     
     @classmethod
     def get_all_csv_files(cls) -> List[str]:
         """Get all available CSV file paths"""
-        available_files = []
-        for file in cls.CSV_FILES:
-            if os.path.exists(file):
-                available_files.append(file)
-        return available_files
+        return list(cls._available_csv_files())
     
     @classmethod
     def is_supported_language(cls, language: str) -> bool:
@@ -166,7 +188,4 @@ class Config:
     @classmethod
     def get_fallback_translation(cls, word: str, target_language: str) -> str:
         """Get fallback translation for common words"""
-        word_lower = word.lower().strip()
-        if target_language in cls.FALLBACK_TRANSLATIONS:
-            return cls.FALLBACK_TRANSLATIONS[target_language].get(word_lower, None)
-        return None
\ No newline at end of file
+        return cls._FLAT_FALLBACK.get((target_language, word.lower().strip()))
\ No newline at end of file
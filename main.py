@@ -5,18 +5,22 @@ Production-ready version with improved error handling, caching, and logging
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi import UploadFile, File
-from Audio_1 import transcribe_audio_file
+from Audio_1 import decode_audio, encode_flac, recognize_google_async, close_http_client
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, FileResponse
 from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Literal, Tuple
 import pandas as pd
+import asyncio
 import os
 import time
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from utils import log_translation
 
 
@@ -33,23 +37,34 @@ logger = logging.getLogger(__name__)
 
 # Initialize services
 translation_service = TranslationService()
+# CPU-bound audio decode/encode runs here instead of on the event loop
+stt_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
 translation_df = pd.DataFrame()
 
 # Load dataset at startup
 try:
-    translation_df = CSVLoader.load_translation_data()
-    logger.info(f"Successfully loaded translation data with {len(translation_df)} entries")
+    # Only read the columns lookups use; other languages in the CSV are never served
+    translation_df = CSVLoader.load_translation_data(languages=list(Config.SUPPORTED_LANGUAGES))
+    logger.info("Successfully loaded translation data with %d entries", len(translation_df))
 except Exception as e:
-    logger.error(f"Error loading CSV: {e}")
+    logger.error("Error loading CSV: %s", e)
     translation_df = pd.DataFrame()
 
+# Per-language entry counts for /available-languages; the data never changes after startup
+language_entry_counts: Dict[str, int] = {
+    code: int((translation_df[code].notna() & (translation_df[code] != '')).sum())
+    if code in translation_df.columns else 0
+    for code in Config.SUPPORTED_LANGUAGES
+}
+
 # Initialize FastAPI app
 app = FastAPI(
     title="English to Local Languages Translator",
     description="Translate English words to Swahili, Haya, and Sukuma languages",
     version="2.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add middleware
@@ -66,10 +81,44 @@ app.add_middleware(
 if os.path.exists("static"):
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Main page, resolved once at startup
+INDEX_HTML_PATH = "index.html"
+index_html_available = os.path.exists(INDEX_HTML_PATH)
+
+# Basic interface served when index.html is missing
+FALLBACK_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <title>English to Local Languages Translator</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .container { max-width: 600px; margin: 0 auto; }
+        h1 { color: #333; }
+        .form-group { margin: 20px 0; }
+        input, select, button { padding: 10px; margin: 5px; }
+        button { background: #007bff; color: white; border: none; cursor: pointer; }
+        .result { margin: 20px 0; padding: 15px; background: #f8f9fa; border-radius: 5px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>English to Local Languages Translator</h1>
+        <p>API is running! Please create index.html for the full interface.</p>
+        <p><strong>API Endpoints:</strong></p>
+        <ul>
+            <li>POST /translate - Translate words</li>
+            <li>GET /health - Health check</li>
+            <li>GET /available-languages - Supported languages</li>
+            <li>GET /api/docs - API documentation</li>
+        </ul>
+    </div>
+</body>
+</html>"""
+
 # Request/Response models
 class TranslationRequest(BaseModel):
     english_word: str = Field(..., min_length=1, max_length=100, description="English word to translate")
-    target_language: str = Field(..., pattern="^(swahili|haya|sukuma)$", description="Target language")
+    target_language: Literal["swahili", "haya", "sukuma"] = Field(..., description="Target language")
 
 class TranslationResponse(BaseModel):
     english: str
@@ -96,79 +145,88 @@ class LanguageInfo(BaseModel):
     entries_count: int
 
 # Global variables for tracking
-start_time = time.time()
-request_count = 0
-translation_stats = {
-    "total_requests": 0,
-    "successful_translations": 0,
-    "failed_translations": 0,
-    "methods_used": {
-        "csv_lookup": 0,
-        "google_translate": 0,
-        "fallback_dictionary": 0,
-        "not_found": 0
-    }
-}
+APP_START_TIME = time.time()
+# Flat counters; per-method counts use "methods_used:<method>" keys
+translation_stats = Counter()
+
+@lru_cache(maxsize=Config.TRANSLATION_CACHE_SIZE)
+def _resolve_local(english_word: str, target_language: str) -> Tuple[str, str]:
+    """Resolve a translation as (translation, method) from the CSV and fallback dictionary"""
+    # Method 1: Try CSV lookup first
+    csv_translation = WordMatcher.search_in_csv(english_word, target_language, translation_df)
+    if csv_translation:
+        return csv_translation, "csv_lookup"
+    
+    # Method 2: Try fallback dictionary
+    fallback_translation = Config.get_fallback_translation(english_word, target_language)
+    if fallback_translation:
+        return fallback_translation, "fallback_dictionary"
+    
+    return "", "not_found"
+
+# Most recent formatted timestamp, keyed by monotonic millisecond
+_timestamp_cache: Dict[int, str] = {}
+
+def _now_iso() -> str:
+    """Current time in ISO format, formatted at most once per millisecond"""
+    key = time.monotonic_ns() // 1_000_000
+    timestamp = _timestamp_cache.get(key)
+    if timestamp is None:
+        timestamp = datetime.now().isoformat()
+        _timestamp_cache.clear()
+        _timestamp_cache[key] = timestamp
+    return timestamp
+
+def _translation_response(english: str, translation: str, target_language: str, method: str,
+                          error: Optional[str] = None) -> ORJSONResponse:
+    """Build a TranslationResponse-shaped reply directly, skipping Pydantic validation of trusted data"""
+    return ORJSONResponse({
+        "english": english,
+        "translation": translation,
+        "target_language": target_language,
+        "language_name": Config.SUPPORTED_LANGUAGES[target_language],
+        "method": method,
+        "success": error is None,
+        "timestamp": _now_iso(),
+        "error": error
+    })
 
 @app.middleware("http")
 async def add_process_time_header(request, call_next):
     """Add processing time to response headers"""
-    start_time = time.time()
+    t0 = time.monotonic_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    response.headers["X-Process-Time"] = str((time.monotonic_ns() - t0) / 1e9)
     return response
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared HTTP clients and the audio worker pool"""
+    await close_http_client()
+    translation_service.close()
+    stt_pool.shutdown(wait=False)
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the main HTML page"""
-    try:
-        if os.path.exists("index.html"):
-            with open("index.html", "r", encoding="utf-8") as f:
-                return HTMLResponse(content=f.read())
-        else:
-            # Return a basic interface if index.html doesn't exist
-            return HTMLResponse(content="""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>English to Local Languages Translator</title>
-                <style>
-                    body { font-family: Arial, sans-serif; margin: 40px; }
-                    .container { max-width: 600px; margin: 0 auto; }
-                    h1 { color: #333; }
-                    .form-group { margin: 20px 0; }
-                    input, select, button { padding: 10px; margin: 5px; }
-                    button { background: #007bff; color: white; border: none; cursor: pointer; }
-                    .result { margin: 20px 0; padding: 15px; background: #f8f9fa; border-radius: 5px; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h1>English to Local Languages Translator</h1>
-                    <p>API is running! Please create index.html for the full interface.</p>
-                    <p><strong>API Endpoints:</strong></p>
-                    <ul>
-                        <li>POST /translate - Translate words</li>
-                        <li>GET /health - Health check</li>
-                        <li>GET /available-languages - Supported languages</li>
-                        <li>GET /api/docs - API documentation</li>
-                    </ul>
-                </div>
-            </body>
-            </html>
-            """)
-    except Exception as e:
-        logger.error(f"Error serving index.html: {e}")
-        return HTMLResponse(content=f"<h1>Error loading page</h1><p>{str(e)}</p>")
+    if index_html_available:
+        return FileResponse(INDEX_HTML_PATH, media_type="text/html")
+    # Return a basic interface if index.html doesn't exist
+    return HTMLResponse(content=FALLBACK_HTML)
 
 @app.post("/transcribe/")
 async def transcribe_audio(file: UploadFile = File(...)):
     if not file.content_type.startswith("audio/"):
         raise HTTPException(400, "Invalid audio file")
-    wav_bytes = await file.read()
+    if file.size is not None and file.size > Config.MAX_UPLOAD_BYTES:
+        raise HTTPException(413, "Audio file too large")
+    # Decode from the spooled upload directly rather than copying it into memory
+    await file.seek(0)
+    loop = asyncio.get_running_loop()
     try:
-        text = transcribe_audio_file(wav_bytes, language=Config.LANGUAGE)
+        pcm = await loop.run_in_executor(stt_pool, decode_audio, file.file)
+        flac_bytes = await loop.run_in_executor(stt_pool, encode_flac, pcm)
+        text = await recognize_google_async(flac_bytes, language=Config.LANGUAGE)
         return {"text": text}
     except Exception as e:
         raise HTTPException(422, str(e))
@@ -176,117 +234,60 @@ async def transcribe_audio(file: UploadFile = File(...)):
 @app.post("/translate", response_model=TranslationResponse)
 async def translate_word(request: TranslationRequest, background_tasks: BackgroundTasks):
     """Translate English word to specified target language"""
-    global request_count, translation_stats
-    
-    request_count += 1
     translation_stats["total_requests"] += 1
     
     try:
+        english_word = request.english_word.strip()
+        # Already validated against the supported languages by the request model
+        target_language = request.target_language
+        
         # Validate input
-        is_valid, error_message = TextProcessor.validate_input(request.english_word)
+        is_valid, error_message = TextProcessor.validate_input(english_word)
         if not is_valid:
             translation_stats["failed_translations"] += 1
             raise HTTPException(status_code=400, detail=error_message)
         
-        english_word = request.english_word.strip()
-        target_language = request.target_language.lower()
+        logger.info("Translation request: '%s' -> %s", english_word, target_language)
         
-        logger.info(f"Translation request: '{english_word}' -> {target_language}")
+        word_key = TextProcessor.normalize_word(english_word)
+        translation, method = _resolve_local(word_key, target_language)
         
-        # Method 1: Try CSV lookup first
-        csv_translation = WordMatcher.search_in_csv(english_word, target_language, translation_df)
-        if csv_translation:
-            translation_stats["successful_translations"] += 1
-            translation_stats["methods_used"]["csv_lookup"] += 1
-            
-            response = TranslationResponse(
-                english=english_word,
-                translation=csv_translation,
-                target_language=target_language,
-                language_name=Config.SUPPORTED_LANGUAGES[target_language],
-                method="csv_lookup",
-                success=True,
-                timestamp=datetime.now().isoformat()
-            )
-            
-            # Log successful translation in background
-            background_tasks.add_task(log_translation, english_word, csv_translation, target_language, "csv_lookup")
-            return response
-        
-        # Method 2: Try fallback dictionary
-        fallback_translation = Config.get_fallback_translation(english_word, target_language)
-        if fallback_translation:
-            translation_stats["successful_translations"] += 1
-            translation_stats["methods_used"]["fallback_dictionary"] += 1
-            
-            response = TranslationResponse(
-                english=english_word,
-                translation=fallback_translation,
-                target_language=target_language,
-                language_name=Config.SUPPORTED_LANGUAGES[target_language],
-                method="fallback_dictionary",
-                success=True,
-                timestamp=datetime.now().isoformat()
-            )
-            
-            background_tasks.add_task(log_translation, english_word, fallback_translation, target_language, "fallback_dictionary")
-            return response
-        
-        # Method 3: For Swahili, use Google Translate
-        if target_language == "swahili":
+        # Method 3: For Swahili, use Google Translate in a worker thread so the
+        # network round-trip and retry back-off don't block the event loop
+        if not translation and target_language == "swahili":
             try:
-                swahili_translation = translation_service.translate_to_swahili(english_word)
-                translation_stats["successful_translations"] += 1
-                translation_stats["methods_used"]["google_translate"] += 1
-                
-                response = TranslationResponse(
-                    english=english_word,
-                    translation=swahili_translation,
-                    target_language=target_language,
-                    language_name=Config.SUPPORTED_LANGUAGES[target_language],
-                    method="google_translate",
-                    success=True,
-                    timestamp=datetime.now().isoformat()
+                translation = await asyncio.get_running_loop().run_in_executor(
+                    None, translation_service.translate_to_swahili, word_key
                 )
-                
-                background_tasks.add_task(log_translation, english_word, swahili_translation, target_language, "google_translate")
-                return response
-                
             except Exception as e:
-                logger.error(f"Google Translate failed for '{english_word}': {str(e)}")
+                logger.error("Google Translate failed for '%s': %s", english_word, e)
                 translation_stats["failed_translations"] += 1
-                translation_stats["methods_used"]["not_found"] += 1
+                translation_stats["methods_used:not_found"] += 1
                 
-                return TranslationResponse(
-                    english=english_word,
-                    translation="",
-                    target_language=target_language,
-                    language_name=Config.SUPPORTED_LANGUAGES[target_language],
-                    method="failed",
-                    success=False,
-                    timestamp=datetime.now().isoformat(),
-                    error=str(e)
-                )
+                return _translation_response(english_word, "", target_language, "failed", str(e))
+            method = "google_translate"
         
-        # Method 4: No translation found
+        if translation:
+            translation_stats["successful_translations"] += 1
+            translation_stats[f"methods_used:{method}"] += 1
+            
+            # Log successful translation in background
+            background_tasks.add_task(log_translation, english_word, translation, target_language, method)
+            return _translation_response(english_word, translation, target_language, method)
+        
+        # No translation found
         translation_stats["failed_translations"] += 1
-        translation_stats["methods_used"]["not_found"] += 1
+        translation_stats["methods_used:not_found"] += 1
         
-        return TranslationResponse(
-            english=english_word,
-            translation="",
-            target_language=target_language,
-            language_name=Config.SUPPORTED_LANGUAGES[target_language],
-            method="not_found",
-            success=False,
-            timestamp=datetime.now().isoformat(),
-            error=f"No {target_language} translation found for '{english_word}'"
+        return _translation_response(
+            english_word, "", target_language, "not_found",
+            f"No {target_language} translation found for '{english_word}'"
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Translation error: {str(e)}")
+        logger.error("Translation error: %s", e)
         translation_stats["failed_translations"] += 1
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
@@ -296,16 +297,11 @@ async def get_available_languages():
     languages = []
     
     for code, name in Config.SUPPORTED_LANGUAGES.items():
-        # Count entries for this language in CSV
-        entries_count = 0
-        if not translation_df.empty and code in translation_df.columns:
-            entries_count = len(translation_df[translation_df[code].notna() & (translation_df[code] != '')])
-        
         languages.append(LanguageInfo(
             code=code,
             name=name,
             available=True,
-            entries_count=entries_count
+            entries_count=language_entry_counts[code]
         ))
     
     return languages
@@ -317,7 +313,16 @@ async def health_check():
         "status": "healthy",
         "message": "English to Local Languages Translator API is running",
         "csv_loaded": not translation_df.empty,
-        "csv_entries": len(translation_df) if not translation_df.empty else 0
+        "csv_entries": len(translation_df) if not translation_df.empty else 0,
+        "translation_stats": {
+            "total_requests": translation_stats["total_requests"],
+            "successful_translations": translation_stats["successful_translations"],
+            "failed_translations": translation_stats["failed_translations"],
+            "methods_used": {
+                method: translation_stats[f"methods_used:{method}"]
+                for method in ("csv_lookup", "google_translate", "fallback_dictionary", "not_found")
+            }
+        }
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+Regression checks for CSV loading
+"""
+
+import os
+
+from config import Config
+from utils import CSVLoader
+
+
+HEADER = "English,Swahili,Haya,Sukuma\n"
+
+
+def ascii_rows(min_bytes):
+    rows = []
+    size = 0
+    i = 0
+    while size < min_bytes:
+        row = f"word{i},sw{i},ha{i},su{i}\n"
+        rows.append(row)
+        size += len(row)
+        i += 1
+    return "".join(rows)
+
+
+def test_non_utf8_text_after_an_ascii_head_falls_back_to_windows_1252(tmp_path, monkeypatch):
+    csv_file = tmp_path / "late_cp1252.csv"
+    csv_file.write_bytes((HEADER + ascii_rows(70000)).encode("ascii") + "caf\xe9,kahawa,x,y\n".encode("cp1252"))
+    monkeypatch.setattr(Config, "get_csv_file_path", lambda: str(csv_file))
+
+    for df in (CSVLoader.load_translation_data(), CSVLoader.load_specific_csv(str(csv_file))):
+        assert df["english"].iloc[-1] == "café"
+
+
+def test_utf8_character_split_by_the_detection_window_is_still_utf8(tmp_path):
+    csv_file = tmp_path / "split_utf8.csv"
+    head = (HEADER + ascii_rows(65000)).encode("ascii")
+    # Pad so the two-byte "é" straddles the 64 KB sniffing window
+    pad = b"x" * (65535 - len(head) - len(b",a,b,c\ncaf")) + b",a,b,c\n"
+    csv_file.write_bytes(head + pad + "café,kahawa,naïve,y\n".encode("utf-8"))
+
+    df = CSVLoader.load_specific_csv(str(csv_file))
+
+    assert df["english"].iloc[-1] == "café"
+    assert df["haya"].iloc[-1] == "naïve"
+
+
+def test_language_column_without_any_values_loads_as_empty_strings(tmp_path, monkeypatch):
+    csv_file = tmp_path / "no_sukuma.csv"
+    csv_file.write_text(HEADER + "dog,mbwa,embwa,\ncat,paka,,\n")
+    monkeypatch.setattr(Config, "get_csv_file_path", lambda: str(csv_file))
+
+    for df in (CSVLoader.load_translation_data(), CSVLoader.load_specific_csv(str(csv_file))):
+        assert len(df) == 2
+        assert df["sukuma"].fillna("").tolist() == ["", ""]
+
+
+def test_parquet_sidecar_is_ignored_when_the_csv_is_replaced_with_an_older_mtime(tmp_path, monkeypatch):
+    csv_file = tmp_path / "dictionary.csv"
+    csv_file.write_text(HEADER + "dog,mbwa,embwa,\n")
+    monkeypatch.setattr(Config, "get_csv_file_path", lambda: str(csv_file))
+
+    assert len(CSVLoader.load_translation_data()) == 1
+    assert (tmp_path / "dictionary.csv.parquet").exists()
+
+    # e.g. restored with cp -p: new content, mtime older than the sidecar
+    csv_file.write_text(HEADER + "dog,mbwa,embwa,\ncat,paka,enjangu,\n")
+    os.utime(csv_file, (1, 1))
+
+    assert len(CSVLoader.load_translation_data()) == 2
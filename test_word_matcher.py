@@ -0,0 +1,67 @@
+"""
+Regression checks for CSV matching and the fallback dictionary
+"""
+
+import pandas as pd
+import pytest
+
+from config import Config
+from utils import CSVLoader, WordMatcher
+
+
+@pytest.fixture
+def translation_df():
+    return CSVLoader._clean_dataframe(pd.DataFrame({
+        'English': ['yellow', 'water', 'dog', 'house', 'red car', 'a'],
+        'Swahili': ['njano', 'maji', 'mbwa', 'nyumba', 'gari jekundu', 'moja'],
+        'Haya': ['', 'amaizi', 'embwa', 'enju', '', ''],
+        'Sukuma': ['', 'minze', '', 'numba', 'gari', ''],
+    }))
+
+
+def resolve(word, target_language, df):
+    """CSV first, then the fallback dictionary, as /translate does"""
+    return (WordMatcher.search_in_csv(word, target_language, df)
+            or Config.get_fallback_translation(word, target_language))
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("hello", "hujambo"),
+    ("mother", "mama"),
+])
+def test_fallback_words_are_not_captured_by_fuzzy_match(translation_df, word, expected):
+    assert WordMatcher.search_in_csv(word, "swahili", translation_df) is None
+    assert resolve(word, "swahili", translation_df) == expected
+
+
+@pytest.mark.parametrize("word", ["hog", "cat", "car"])
+def test_dissimilar_words_do_not_fuzzy_match(translation_df, word):
+    assert WordMatcher.search_in_csv(word, "haya", translation_df) is None
+
+
+@pytest.mark.parametrize("phrase", [
+    "my neighbour has a very big dog",
+    "the water is cold today",
+    "i love my house",
+])
+def test_sentences_do_not_fuzzy_match_a_word_they_contain(translation_df, phrase):
+    assert WordMatcher.search_in_csv(phrase, "swahili", translation_df) is None
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("watr", "maji"),
+    ("housee", "nyumba"),
+    ("red car", "gari jekundu"),
+    ("car red", "gari jekundu"),
+])
+def test_near_spellings_still_match(translation_df, word, expected):
+    assert WordMatcher.search_in_csv(word, "swahili", translation_df) == expected
+
+
+def test_derived_frames_do_not_reuse_stale_match_indices(translation_df):
+    subset = translation_df[translation_df["english"] != "water"]
+
+    assert WordMatcher.search_in_csv("dog", "swahili", subset) == "mbwa"
+    assert WordMatcher.search_in_csv("house", "swahili", subset) == "nyumba"
+    assert WordMatcher.search_in_csv("dog", "swahili", translation_df.iloc[::-1]) == "mbwa"
+    assert WordMatcher.search_in_csv("water", "swahili", translation_df) == "maji"
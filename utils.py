@@ -2,13 +2,22 @@
 Utility functions for the English to Local Languages Translator
 """
 
+import codecs
+import numpy as np
 import pandas as pd
 import os
 import re
+import sys
 import time
 import random
+import weakref
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
+import charset_normalizer
+import diskcache
+import httpx
 from googletrans import Translator
+from rapidfuzz import fuzz, process
 from config import Config
 import logging
 
@@ -16,139 +25,368 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the per-request cleaning and validation paths
+_WORD_CLEAN_RE = re.compile(r'[^\w\s\'-]')
+_VALID_INPUT_RE = re.compile(r'^[a-zA-Z\s\'-]+\Z')
+
+# Byte-order marks and the codec each implies (UTF-32 first: its LE BOM starts with UTF-16's)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Bump when loading or cleaning changes, so parquet sidecars written by older code are ignored
+_SIDECAR_FORMAT_VERSION = 1
+
 
 class CSVLoader:
     """Handle CSV file loading and processing"""
 
     @staticmethod
-    def load_translation_data() -> pd.DataFrame:
-        """Load and clean the translation dataset with robust error handling"""
+    def load_translation_data(languages: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load and clean the translation dataset with robust error handling
+
+        When languages is given, only the english column and those language columns are read.
+        """
         csv_file = Config.get_csv_file_path()
         
         if not csv_file:
             raise FileNotFoundError(f"CSV file not found. Looked for: {Config.CSV_FILES}")
         
-        logger.info(f"Loading CSV file: {csv_file}")
+        # Reuse the cleaned frame until the file changes on disk
+        stat = os.stat(csv_file)
+        return CSVLoader._load_cached(
+            csv_file, stat.st_mtime, stat.st_size, tuple(languages) if languages is not None else None
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _load_cached(csv_file: str, mtime: float, size: int,
+                     languages: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+        """Load one version of a CSV file; mtime and size only key the cache.
+
+        The cleaned frame is also written to a parquet sidecar (one per column
+        selection), read back on later starts while the CSV's size and mtime and the
+        sidecar format version all match what was recorded in its metadata.
+        """
+        sidecar = csv_file + ('.parquet' if languages is None else f".{'-'.join(languages)}.parquet")
+        source = {'csv_size': size, 'csv_mtime': mtime, 'format_version': _SIDECAR_FORMAT_VERSION}
+        if os.path.exists(sidecar):
+            try:
+                # pandas round-trips attrs through the parquet metadata
+                df = pd.read_parquet(sidecar)
+                if df.attrs.get('sidecar_source') == source:
+                    df.attrs = {}
+                    CSVLoader.build_match_indices(df)
+                    logger.info("Loaded %d translation entries from %s", len(df), sidecar)
+                    return df
+                logger.info("Parquet cache %s is out of date", sidecar)
+            except Exception as e:
+                logger.warning("Could not read parquet cache %s: %s", sidecar, e)
+        
+        logger.info("Loading CSV file: %s", csv_file)
         
         df = None
-        for encoding in Config.CSV_ENCODINGS:
+        for encoding in CSVLoader._candidate_encodings(csv_file):
             try:
-                df = pd.read_csv(csv_file, encoding=encoding)
-                logger.info(f"Successfully loaded CSV with {encoding} encoding")
+                df = CSVLoader._read_csv(csv_file, encoding, languages)
+                logger.info("Successfully loaded CSV with %s encoding", encoding)
                 break
             except UnicodeDecodeError:
-                logger.warning(f"Failed to load CSV with {encoding} encoding")
+                logger.warning("Failed to load CSV with %s encoding", encoding)
                 continue
             except Exception as e:
-                logger.error(f"Error loading CSV with {encoding}: {str(e)}")
+                logger.error("Error loading CSV with %s: %s", encoding, e)
                 continue
         
         if df is None:
             raise Exception(f"Could not read CSV file with any encoding: {Config.CSV_ENCODINGS}")
         
-        df = CSVLoader._clean_dataframe(df)
-        logger.info(f"Loaded {len(df)} translation entries")
+        df = CSVLoader._clean_dataframe(df, languages)
+        logger.info("Loaded %d translation entries", len(df))
+        
+        try:
+            # The match indices are rebuilt on load, so only the source fingerprint is stored
+            snapshot = df.copy(deep=False)
+            snapshot.attrs = {'sidecar_source': source}
+            snapshot.to_parquet(sidecar)
+        except Exception as e:
+            logger.warning("Could not write parquet cache %s: %s", sidecar, e)
         
         return df
 
     @classmethod
-    def load_specific_csv(cls, csv_file: str) -> pd.DataFrame:
-        """Load a specific CSV file with encoding detection"""
+    def load_specific_csv(cls, csv_file: str, languages: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load a specific CSV file with encoding detection, optionally reading only some languages"""
         if not os.path.exists(csv_file):
-            logger.warning(f"CSV file not found: {csv_file}")
+            logger.warning("CSV file not found: %s", csv_file)
             return pd.DataFrame()
         
-        logger.info(f"Loading CSV file: {csv_file}")
+        logger.info("Loading CSV file: %s", csv_file)
         
-        for encoding in Config.CSV_ENCODINGS:
+        for encoding in CSVLoader._candidate_encodings(csv_file):
             try:
-                df = pd.read_csv(csv_file, encoding=encoding)
-                logger.info(f"Successfully loaded CSV with {encoding} encoding")
+                df = CSVLoader._read_csv(csv_file, encoding, languages)
+                logger.info("Successfully loaded CSV with %s encoding", encoding)
                 
                 # Clean column names
                 df.columns = df.columns.str.strip().str.lower()
                 
                 # Check for required columns
-                required_columns = ['english'] + list(Config.SUPPORTED_LANGUAGES.keys())
+                required_columns = ['english'] + list(languages if languages is not None else Config.SUPPORTED_LANGUAGES)
                 missing_columns = [col for col in required_columns if col not in df.columns]
                 
                 if missing_columns:
-                    logger.warning(f"Missing columns in CSV: {missing_columns}")
+                    logger.warning("Missing columns in CSV: %s", missing_columns)
                 
                 # Clean and prepare data
                 df = df.dropna(subset=['english'])
                 df['english'] = df['english'].str.strip().str.lower()
                 df = df[df['english'] != '']
                 
-                logger.info(f"Loaded {len(df)} translation entries")
+                logger.info("Loaded %d translation entries", len(df))
                 return df
                 
             except UnicodeDecodeError:
-                logger.warning(f"Failed to load CSV with {encoding} encoding")
+                logger.warning("Failed to load CSV with %s encoding", encoding)
                 continue
             except Exception as e:
-                logger.error(f"Error loading CSV file {csv_file}: {e}")
+                logger.error("Error loading CSV file %s: %s", csv_file, e)
                 continue
         
-        logger.error(f"Failed to load CSV file {csv_file} with any encoding")
+        logger.error("Failed to load CSV file %s with any encoding", csv_file)
         return pd.DataFrame()
 
     @staticmethod
-    def _clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    def _read_csv(csv_file: str, encoding: str, languages: Optional[List[str]] = None) -> pd.DataFrame:
+        """Parse with the multi-threaded pyarrow engine, falling back to the C engine
+
+        When languages is given, columns other than english and those languages are never parsed.
+        """
+        usecols = None
+        if languages is not None:
+            # Header names are matched case-insensitively, as _clean_dataframe lowercases them
+            wanted = {'english', *languages}
+            header = pd.read_csv(csv_file, encoding=encoding, nrows=0).columns
+            usecols = [col for col in header if col.strip().lower() in wanted]
+        
+        try:
+            df = pd.read_csv(csv_file, encoding=encoding, usecols=usecols, engine='pyarrow', dtype_backend='pyarrow')
+        except Exception as e:
+            # Unusual dialects, or pyarrow not installed; decode errors surface from the C engine
+            logger.warning("pyarrow engine could not read %s with %s: %s", csv_file, encoding, e)
+            return pd.read_csv(csv_file, encoding=encoding, usecols=usecols)
+        
+        # pyarrow types text that is not valid in this encoding as binary instead of raising,
+        # so report it as a decode failure and let the caller try the next encoding
+        binary_columns = [col for col, dtype in df.dtypes.items()
+                          if isinstance(dtype, pd.ArrowDtype) and dtype.type is bytes]
+        if binary_columns:
+            raise UnicodeDecodeError(encoding, b'', 0, 0, f"undecodable text in columns {binary_columns}")
+        
+        # A column with no values at all comes back as pyarrow's null type, which string methods reject
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.ArrowDtype) and str(dtype.pyarrow_dtype) == 'null':
+                df[col] = df[col].astype('string[pyarrow]')
+        return df
+
+    @staticmethod
+    def _detect_encoding(csv_file: str) -> Optional[str]:
+        """Sniff the file encoding from its BOM, or from charset detection on the first 64 KB"""
+        with open(csv_file, 'rb') as f:
+            head = f.read(65536)
+        
+        for bom, encoding in _BOM_ENCODINGS:
+            if head.startswith(bom):
+                return encoding
+        
+        # UTF-8 first, as an incremental decode so a character cut off at the end of
+        # the head doesn't disqualify it; an ASCII head is also treated as UTF-8
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        # Only choose among the configured encodings; unconstrained guesses on short files are unreliable
+        best = charset_normalizer.from_bytes(head, cp_isolation=Config.CSV_ENCODINGS).best()
+        return best.encoding if best is not None else None
+
+    @staticmethod
+    def _candidate_encodings(csv_file: str) -> List[str]:
+        """Detected encoding first, then the configured encodings as fallbacks"""
+        try:
+            detected = CSVLoader._detect_encoding(csv_file)
+        except Exception as e:
+            logger.warning("Could not detect encoding of %s: %s", csv_file, e)
+            detected = None
+        
+        if not detected:
+            return list(Config.CSV_ENCODINGS)
+        detected_name = codecs.lookup(detected).name
+        return [detected] + [enc for enc in Config.CSV_ENCODINGS if codecs.lookup(enc).name != detected_name]
+
+    @staticmethod
+    def _clean_dataframe(df: pd.DataFrame, languages: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
         """Clean and validate the dataframe"""
         df.columns = df.columns.str.lower().str.strip()
         
-        required_columns = ['english'] + list(Config.SUPPORTED_LANGUAGES.keys())
+        required_columns = ['english'] + list(languages if languages is not None else Config.SUPPORTED_LANGUAGES)
         missing_columns = [col for col in required_columns if col not in df.columns]
         
         if missing_columns:
-            logger.warning(f"Missing columns in CSV: {missing_columns}")
+            logger.warning("Missing columns in CSV: %s", missing_columns)
         
         for col in df.columns:
             if col in required_columns:
                 df[col] = df[col].fillna('').astype(str).str.strip()
-                df[col] = df[col].apply(lambda x: ' '.join(x.split()) if x else '')
+                df[col] = df[col].str.replace(r'\s+', ' ', regex=True).str.strip()
         
         df = df[df['english'].str.len() > 0]
         
+        CSVLoader.build_match_indices(df)
         return df
 
+    @staticmethod
+    def ensure_match_indices(df: pd.DataFrame) -> None:
+        """Build the match indices unless df.attrs holds ones built for this very frame
+
+        pandas copies attrs onto every frame derived from df (slices, sorts, copies),
+        where the stored row positions no longer line up, so ownership is checked by identity.
+        """
+        owner = df.attrs.get('match_indices_owner')
+        if owner is None or owner() is not df:
+            CSVLoader.build_match_indices(df)
+
+    @staticmethod
+    def build_match_indices(df: pd.DataFrame) -> None:
+        """Precompute per-row lookup structures used by WordMatcher and store them in df.attrs"""
+        df.attrs['match_indices_owner'] = weakref.ref(df)
+        english_lower = [entry.lower().strip() for entry in df['english'].tolist()]
+        
+        # Normalized English -> row positions, in file order, for O(1) exact matching
+        exact_index = {}
+        for idx, entry in enumerate(english_lower):
+            exact_index.setdefault(' '.join(entry.split()), []).append(idx)
+        df.attrs['exact_index'] = exact_index
+        
+        # Lowercase English as a NumPy string array for vectorized substring search
+        df.attrs['english_lower'] = np.array(english_lower, dtype=str)
+        
+        # The same strings shortest first (file order among equal lengths), with their row positions,
+        # so the first substring hit is the most specific entry
+        lengths = np.fromiter((len(entry) for entry in english_lower), dtype=np.int64, count=len(english_lower))
+        length_order = np.argsort(lengths, kind='stable')
+        df.attrs['length_order'] = length_order
+        df.attrs['english_by_length'] = df.attrs['english_lower'][length_order]
+        
+        # Plain list of the same strings as RapidFuzz choices
+        df.attrs['english_list'] = english_lower
+
 
 
 class TranslationService:
     """Handle all translation operations"""
     
     def __init__(self):
-        self.translator = Translator()
-        self.translation_cache = {}  # Simple in-memory cache
+        # The Translator keeps one pooled HTTP/2 client (httpx default: 10 keep-alive
+        # connections) for the life of the service, so TLS setup is paid once
+        self.translator = Translator(timeout=httpx.Timeout(Config.GOOGLE_TRANSLATE_TIMEOUT))
+        # Persistent cache shared across restarts and worker processes, with LRU eviction
+        self.translation_cache = diskcache.Cache(
+            Config.GOOGLE_TRANSLATE_CACHE_DIR,
+            size_limit=Config.GOOGLE_TRANSLATE_CACHE_SIZE_LIMIT,
+            eviction_policy='least-recently-used'
+        )
+        # Bounded in-process LRU in front of the disk cache, keyed by the lowercased word
+        self._translate_lru = lru_cache(maxsize=Config.TRANSLATION_CACHE_SIZE)(self._translate_uncached)
+    
+    def cache_clear(self):
+        """Empty the in-process translation LRU; the disk cache is left intact"""
+        self._translate_lru.cache_clear()
+    
+    def close(self):
+        """Close the pooled HTTP connections to Google Translate and the translation cache"""
+        self.translator.client.close()
+        self.translation_cache.close()
     
     def translate_to_swahili(self, english_word: str) -> str:
         """Translate English to Swahili using Google Translate with caching"""
-        # Check cache first
-        cache_key = f"en_to_sw_{english_word.lower()}"
-        if cache_key in self.translation_cache:
-            logger.info(f"Using cached translation for: {english_word}")
-            return self.translation_cache[cache_key]
+        return self._translate_lru(english_word.lower())
+    
+    def _translate_uncached(self, english_word: str) -> str:
+        """Disk cache lookup, then Google Translate; wrapped by the in-process LRU"""
+        cache_key = f"en_to_sw_{english_word}"
+        cached = self.translation_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached translation for: %s", english_word)
+            return cached
+        
+        translation = self._translate_with_retries(english_word)
+        # Cache the result
+        self.translation_cache.set(cache_key, translation, expire=Config.GOOGLE_TRANSLATE_CACHE_TTL)
+        logger.info("Successfully translated '%s' to '%s'", english_word, translation)
+        return translation
+    
+    def translate_batch(self, english_words: List[str]) -> List[str]:
+        """Translate many English words to Swahili, sending cache misses in batches"""
+        cache_keys = [f"en_to_sw_{word.lower()}" for word in english_words]
+        results = {}
+        # First spelling of each uncached word, deduplicated by cache key
+        misses = {}
+        for word, key in zip(english_words, cache_keys):
+            if key in results or key in misses:
+                continue
+            cached = self.translation_cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                misses[key] = word
+        misses = list(misses.values())
+        
+        # One request per chunk: words are newline-joined and the reply split back into lines
+        batch_size = Config.GOOGLE_TRANSLATE_BATCH_SIZE
+        for start in range(0, len(misses), batch_size):
+            chunk = misses[start:start + batch_size]
+            translations = [line.strip() for line in self._translate_with_retries('\n'.join(chunk)).split('\n')]
+            
+            if len(translations) != len(chunk) or not all(translations):
+                # Line structure was not preserved, so the lines can't be paired with words
+                logger.warning("Batch translation of %d words was misaligned; translating individually", len(chunk))
+                translations = [self._translate_with_retries(word) for word in chunk]
+            
+            for word, translation in zip(chunk, translations):
+                key = f"en_to_sw_{word.lower()}"
+                results[key] = translation
+                self.translation_cache.set(key, translation, expire=Config.GOOGLE_TRANSLATE_CACHE_TTL)
         
-        # Translate using Google Translate
+        logger.info("Batch translated %d words (%d not cached)", len(english_words), len(misses))
+        return [results[key] for key in cache_keys]
+    
+    def _translate_with_retries(self, text: str) -> str:
+        """Call Google Translate, retrying network errors and rate limits"""
         for attempt in range(Config.GOOGLE_TRANSLATE_MAX_RETRIES):
             try:
                 if attempt > 0:
                     delay = random.uniform(*Config.GOOGLE_TRANSLATE_RETRY_DELAY)
                     time.sleep(delay)
                 
-                result = self.translator.translate(
-                    english_word, 
-                    src=Config.GOOGLE_TRANSLATE_CODES['english'], 
-                    dest=Config.GOOGLE_TRANSLATE_CODES['swahili']
-                )
+                started = time.monotonic()
+                try:
+                    result = self.translator.translate(
+                        text, 
+                        src=Config.GOOGLE_TRANSLATE_CODES['english'], 
+                        dest=Config.GOOGLE_TRANSLATE_CODES['swahili']
+                    )
+                finally:
+                    # Per-call latency, so retry and rate-limit delays can be tuned from data
+                    logger.info("Google Translate call (attempt %d) took %.3fs", attempt + 1, time.monotonic() - started)
                 
                 if result and hasattr(result, 'text') and result.text:
-                    translation = result.text.strip()
-                    # Cache the result
-                    self.translation_cache[cache_key] = translation
-                    logger.info(f"Successfully translated '{english_word}' to '{translation}'")
-                    return translation
+                    return result.text.strip()
                 else:
                     raise Exception("Empty translation result")
                     
@@ -158,18 +396,18 @@ class TranslationService:
                 if any(keyword in error_msg for keyword in ['timeout', 'handshake', 'ssl', 'connection']):
                     if attempt == Config.GOOGLE_TRANSLATE_MAX_RETRIES - 1:
                         raise Exception(Config.MESSAGES["network_error"])
-                    logger.warning(f"Network error on attempt {attempt + 1}: {str(e)}")
+                    logger.warning("Network error on attempt %d: %s", attempt + 1, e)
                     continue
                     
                 elif 'rate limit' in error_msg or '429' in error_msg:
                     if attempt == Config.GOOGLE_TRANSLATE_MAX_RETRIES - 1:
                         raise Exception(Config.MESSAGES["rate_limit"])
-                    logger.warning(f"Rate limit hit on attempt {attempt + 1}")
+                    logger.warning("Rate limit hit on attempt %d", attempt + 1)
                     time.sleep(Config.GOOGLE_TRANSLATE_RATE_LIMIT_DELAY)
                     continue
                     
                 else:
-                    logger.error(f"Translation service error: {str(e)}")
+                    logger.error("Translation service error: %s", e)
                     raise Exception(f"Translation service error: {str(e)}")
         
         raise Exception(Config.MESSAGES["translation_failed"])
@@ -185,117 +423,109 @@ class WordMatcher:
             return None
         
         english_clean = WordMatcher._clean_word(english_word)
+        # Resolve the target column once; the matchers index by position
+        tgt_idx = df.columns.get_loc(target_language)
         
-        # Method 1: Exact match
-        exact_match = WordMatcher._exact_match(english_clean, target_language, df)
+        # Method 1: Exact match (case- and whitespace-insensitive via the prebuilt index)
+        exact_match = WordMatcher._exact_match(english_clean, tgt_idx, df)
         if exact_match:
-            logger.info(f"Found exact match for '{english_word}' -> '{exact_match}'")
+            logger.info("Found exact match for '%s' -> '%s'", english_word, exact_match)
             return exact_match
         
-        # Method 2: Case-insensitive match
-        case_match = WordMatcher._case_insensitive_match(english_clean, target_language, df)
-        if case_match:
-            logger.info(f"Found case-insensitive match for '{english_word}' -> '{case_match}'")
-            return case_match
-        
-        # Method 3: Partial match (contains)
-        partial_match = WordMatcher._partial_match(english_clean, target_language, df)
+        # Method 2: Partial match (contains)
+        partial_match = WordMatcher._partial_match(english_clean, tgt_idx, df)
         if partial_match:
-            logger.info(f"Found partial match for '{english_word}' -> '{partial_match}'")
+            logger.info("Found partial match for '%s' -> '%s'", english_word, partial_match)
             return partial_match
         
-        # Method 4: Fuzzy match (similar words)
-        fuzzy_match = WordMatcher._fuzzy_match(english_clean, target_language, df)
+        # Method 3: Fuzzy match (similar words)
+        fuzzy_match = WordMatcher._fuzzy_match(english_clean, tgt_idx, df)
         if fuzzy_match:
-            logger.info(f"Found fuzzy match for '{english_word}' -> '{fuzzy_match}'")
+            logger.info("Found fuzzy match for '%s' -> '%s'", english_word, fuzzy_match)
             return fuzzy_match
         
         return None
     
+    @staticmethod
+    def search_many(words: List[str], target_language: str, df: pd.DataFrame) -> Dict[str, Optional[str]]:
+        """Search many English words at once; each distinct word is matched only once"""
+        if df.empty or target_language not in df.columns:
+            return {word: None for word in words}
+        
+        tgt_idx = df.columns.get_loc(target_language)
+        by_clean = {}
+        results = {}
+        for word in words:
+            if word in results:
+                continue
+            english_clean = WordMatcher._clean_word(word)
+            if english_clean not in by_clean:
+                # Exact matches are dictionary probes; only misses pay for the partial and fuzzy scans
+                by_clean[english_clean] = (
+                    WordMatcher._exact_match(english_clean, tgt_idx, df)
+                    or WordMatcher._partial_match(english_clean, tgt_idx, df)
+                    or WordMatcher._fuzzy_match(english_clean, tgt_idx, df)
+                )
+            results[word] = by_clean[english_clean]
+        
+        if logger.isEnabledFor(logging.INFO):
+            found = sum(1 for translation in results.values() if translation)
+            logger.info("Matched %d of %d distinct words in CSV", found, len(results))
+        return results
+    
     @staticmethod
     def _clean_word(word: str) -> str:
         """Clean and normalize a word"""
         # Remove extra whitespace and convert to lowercase
         cleaned = ' '.join(word.strip().lower().split())
         # Remove punctuation except hyphens and apostrophes
-        cleaned = re.sub(r'[^\w\s\'-]', '', cleaned)
+        cleaned = _WORD_CLEAN_RE.sub('', cleaned)
         return cleaned
     
     @staticmethod
-    def _exact_match(word: str, target_language: str, df: pd.DataFrame) -> Optional[str]:
+    def _exact_match(word: str, tgt_idx: int, df: pd.DataFrame) -> Optional[str]:
         """Find exact match in CSV"""
-        matches = df[df['english'].str.lower().str.strip() == word]
-        return WordMatcher._get_best_translation(matches, target_language)
-    
-    @staticmethod
-    def _case_insensitive_match(word: str, target_language: str, df: pd.DataFrame) -> Optional[str]:
-        """Find case-insensitive match"""
-        matches = df[df['english'].str.lower().str.strip().str.replace(r'\s+', ' ', regex=True) == word]
-        return WordMatcher._get_best_translation(matches, target_language)
+        CSVLoader.ensure_match_indices(df)
+        
+        return WordMatcher._first_translation(df, df.attrs['exact_index'].get(word, ()), tgt_idx)
     
     @staticmethod
-    def _partial_match(word: str, target_language: str, df: pd.DataFrame) -> Optional[str]:
-        """Find partial match (word contains or is contained in CSV entry)"""
-        # Try both directions: CSV contains word, and word contains CSV entry
-        contains_matches = df[df['english'].str.lower().str.contains(word, na=False, regex=False)]
-        contained_matches = df[df['english'].str.lower().apply(lambda x: word in x if x else False)]
-        
-        # Combine and prioritize shorter matches (more specific)
-        all_matches = pd.concat([contains_matches, contained_matches]).drop_duplicates()
-        if not all_matches.empty:
-            # Sort by length of English word (shorter = more specific)
-            all_matches = all_matches.sort_values('english', key=lambda x: x.str.len())
-            return WordMatcher._get_best_translation(all_matches, target_language)
-        
-        return None
+    def _partial_match(word: str, tgt_idx: int, df: pd.DataFrame) -> Optional[str]:
+        """Find partial match (CSV entry contains the word)"""
+        CSVLoader.ensure_match_indices(df)
+        
+        # Single C-level substring pass over the length-sorted lowercase column;
+        # hits come out shortest (most specific) first, so the first usable one wins
+        hits = np.flatnonzero(np.char.find(df.attrs['english_by_length'], word) >= 0)
+        return WordMatcher._first_translation(df, df.attrs['length_order'][hits], tgt_idx)
     
     @staticmethod
-    def _fuzzy_match(word: str, target_language: str, df: pd.DataFrame) -> Optional[str]:
-        """Find fuzzy match using simple similarity"""
-        # Simple similarity based on common words/substrings
-        word_parts = set(word.split())
+    def _fuzzy_match(word: str, tgt_idx: int, df: pd.DataFrame) -> Optional[str]:
+        """Find fuzzy match using RapidFuzz token-sort similarity"""
+        CSVLoader.ensure_match_indices(df)
         
-        best_match = None
-        best_score = 0
+        if not word.strip():
+            return None
         
-        for idx, row in df.iterrows():
-            english_entry = row['english'].lower().strip()
-            if not english_entry:
-                continue
-                
-            entry_parts = set(english_entry.split())
-            
-            # Calculate Jaccard similarity
-            intersection = word_parts.intersection(entry_parts)
-            union = word_parts.union(entry_parts)
-            
-            if union:
-                similarity = len(intersection) / len(union)
-                if similarity > best_score and similarity >= 0.5:  # 50% similarity threshold
-                    translation = WordMatcher._get_best_translation(pd.DataFrame([row]), target_language)
-                    if translation:
-                        best_match = translation
-                        best_score = similarity
-        
-        return best_match
+        # Score every entry in one C++ call (entries below the cutoff score 0); cdist only
+        # parallelises across queries, so a single word is scored on one thread
+        cutoff = Config.FUZZY_MATCH_CUTOFF
+        scores = process.cdist(
+            [word], df.attrs['english_list'], scorer=fuzz.token_sort_ratio, score_cutoff=cutoff
+        )[0]
+        
+        # Best score first, earliest row on ties
+        candidates = np.flatnonzero(scores >= cutoff)
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return WordMatcher._first_translation(df, candidates, tgt_idx)
     
     @staticmethod
-    def _get_best_translation(matches: pd.DataFrame, target_language: str) -> Optional[str]:
-        """Get the best translation from matches"""
-        if matches.empty:
-            return None
-        
-        # Filter out empty translations
-        valid_matches = matches[
-            (matches[target_language].notna()) & 
-            (matches[target_language].str.strip() != '')
-        ]
-        
-        if not valid_matches.empty:
-            # Return the first valid translation
-            translation = valid_matches.iloc[0][target_language].strip()
-            return translation if translation else None
-        
+    def _first_translation(df: pd.DataFrame, positions, tgt_idx: int) -> Optional[str]:
+        """Return the first non-empty translation among the given row positions"""
+        for idx in positions:
+            translation = df.iat[idx, tgt_idx]
+            if isinstance(translation, str) and translation.strip():
+                return translation.strip()
         return None
 
 
@@ -305,32 +535,33 @@ class TextProcessor:
     @staticmethod
     def validate_input(text: str) -> Tuple[bool, str]:
         """Validate user input"""
-        if not text or not text.strip():
+        text = text.strip() if text else ''
+        if not text:
             return False, Config.MESSAGES["empty_word"]
         
         # Check for reasonable length
-        if len(text.strip()) > 100:
+        if len(text) > 100:
             return False, "Word is too long (max 100 characters)"
         
-        # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r'^[a-zA-Z\s\'-]+$', text.strip()):
+        # Check for valid characters (letters, spaces, hyphens, apostrophes);
+        # plain ASCII words are settled by str methods before reaching the regex
+        if text.isascii() and all(c.isalpha() or c in " '-" for c in text):
+            return True, ""
+        if not _VALID_INPUT_RE.match(text):
             return False, "Word contains invalid characters"
         
         return True, ""
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def normalize_word(word: str) -> str:
+        """Lowercase and strip a word, interning the result so repeated lookups share one key"""
+        return sys.intern(word.strip().lower())
+    
     @staticmethod
     def detect_language(text: str) -> str:
         """Simple language detection based on patterns"""
-        # This is a simple heuristic - in a real app you might use a proper language detection library
-        text_lower = text.lower().strip()
-        
-        # Common English patterns
-        english_indicators = ['the', 'and', 'or', 'but', 'is', 'are', 'was', 'were', 'have', 'has', 'will', 'would']
-        
-        if any(indicator in text_lower.split() for indicator in english_indicators):
-            return 'english'
-        
-        # For now, assume English if we can't detect
+        # Input is always treated as English for now; a real app might use a proper language detection library
         return 'english'
     
     @staticmethod
@@ -346,4 +577,4 @@ class TextProcessor:
         }
 
 def log_translation(english_word: str, translation: str, target_language: str, method: str):
-    logger.info(f"Logged Translation - '{english_word}' -> '{translation}' | Language: {target_language} | Method: {method}")
+    logger.info("Logged Translation - '%s' -> '%s' | Language: %s | Method: %s", english_word, translation, target_language, method)